@@ -0,0 +1,193 @@
+import sys
+import threading
+import types
+import unittest
+from unittest import mock
+
+import transcribe
+
+# Low sample rate so the fake audio below stays small
+RATE = 100
+
+
+class FakeSegment:
+    def __init__(self, text, start, end):
+        self.text = text
+        self.start = start
+        self.end = end
+
+
+class FakeInfo:
+    def __init__(self, language):
+        self.language = language
+
+
+class FakeModel:
+    """
+    Stands in for WhisperModel. Like Whisper, it lays out 10 s segments from
+    the start of whatever audio it is given, so times are chunk-relative.
+    Each sample's value is its index in the whole file, which lets the
+    segment text record the absolute start sample.
+    """
+
+    detected_language = "de"
+
+    def __init__(self):
+        self.calls = []
+        self.options = {}
+        self.lock = threading.Lock()
+
+    def transcribe(self, audio, **kwargs):
+        with self.lock:
+            self.calls.append((audio[0], len(audio)))
+            self.options[audio[0]] = kwargs
+        length = len(audio) / RATE
+        segments = []
+        start = 0.0
+        while start < length:
+            end = min(start + 10, length)
+            segments.append(FakeSegment(str(audio[int(start * RATE)]), start, end))
+            start = end
+        info = FakeInfo(kwargs.get("language") or self.detected_language)
+        return iter(segments), info
+
+
+def make_app(model, chunks_per_file, language="en"):
+    app = transcribe.TranscriberApp.__new__(transcribe.TranscriberApp)
+    app.model = model
+    app.parallel_model = model
+    app.single_pass_model = model
+    app.chunks_per_file = chunks_per_file
+    app.worker_language = language
+    app.worker_call_mode = True
+    return app
+
+
+class SilenceSplitPointsTest(unittest.TestCase):
+    def test_cuts_in_the_middle_of_silences(self):
+        speech = [
+            {"start": 0, "end": 400},
+            {"start": 500, "end": 900},
+            {"start": 1000, "end": 2000},
+        ]
+        self.assertEqual(transcribe.silence_split_points(speech, 2000, 2, 100), [0, 950, 2000])
+        self.assertEqual(transcribe.silence_split_points(speech, 2000, 3, 100), [0, 450, 950, 2000])
+
+    def test_no_silence_means_no_cut(self):
+        speech = [{"start": 0, "end": 2000}]
+        self.assertEqual(transcribe.silence_split_points(speech, 2000, 4, 100), [0, 2000])
+        self.assertEqual(transcribe.silence_split_points([], 2000, 4, 100), [0, 2000])
+
+    def test_never_more_chunks_than_silences_allow(self):
+        speech = [{"start": 0, "end": 900}, {"start": 1100, "end": 2000}]
+        self.assertEqual(transcribe.silence_split_points(speech, 2000, 4, 100), [0, 1000, 2000])
+
+    def test_every_chunk_is_at_least_min_samples(self):
+        # 150 s with pauses at 5, 10 and 140 s: every possible cut would
+        # leave a piece shorter than 30 s
+        speech = [
+            {"start": 0, "end": 450},
+            {"start": 550, "end": 950},
+            {"start": 1050, "end": 13950},
+            {"start": 14050, "end": 15000},
+        ]
+        self.assertEqual(transcribe.silence_split_points(speech, 15000, 4, 3000), [0, 15000])
+
+        # A pause in the middle is still used
+        speech[1:3] = [{"start": 550, "end": 7450}, {"start": 7550, "end": 13950}]
+        self.assertEqual(transcribe.silence_split_points(speech, 15000, 4, 3000), [0, 7500, 15000])
+
+
+class IterSegmentsTest(unittest.TestCase):
+    def setUp(self):
+        self.speech = []
+        vad = types.ModuleType("faster_whisper.vad")
+        vad.get_speech_timestamps = lambda audio, **kwargs: self.speech
+        package = types.ModuleType("faster_whisper")
+        package.vad = vad
+
+        patches = [
+            mock.patch.object(transcribe, "SAMPLING_RATE", RATE),
+            mock.patch.dict(sys.modules, {"faster_whisper": package, "faster_whisper.vad": vad}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def run_segments(self, chunks_per_file, duration=1000, pause_every=100, language="en"):
+        # Speech with a 2 s pause every pause_every seconds (samples at RATE)
+        self.duration = duration
+        self.speech = [
+            {"start": t * RATE, "end": min(t + pause_every - 2, duration) * RATE}
+            for t in range(0, duration, pause_every)
+        ]
+        model = FakeModel()
+        app = make_app(model, chunks_per_file, language)
+        audio = list(range(duration * RATE))
+        segments = [
+            (int(text) / RATE, end)
+            for text, end in app.iter_segments(audio, float(self.duration))
+        ]
+        return model, segments
+
+    def assert_covers_whole_file(self, segments):
+        # Every stretch of audio is transcribed exactly once, in order
+        self.assertEqual(segments[0][0], 0)
+        for (_, prev_end), (start, _) in zip(segments, segments[1:]):
+            self.assertAlmostEqual(start, prev_end)
+        self.assertAlmostEqual(segments[-1][1], self.duration)
+
+    def test_long_file_is_split_at_silences_and_stitched(self):
+        model, segments = self.run_segments(chunks_per_file=4)
+
+        self.assertEqual(len(model.calls), 4)
+        silences = [
+            (prev["end"], cur["start"])
+            for prev, cur in zip(self.speech, self.speech[1:])
+        ]
+        # Chunks run on parallel threads, so calls can be recorded in any order
+        for first_sample, _ in sorted(model.calls)[1:]:
+            self.assertTrue(any(lo <= first_sample <= hi for lo, hi in silences))
+        self.assert_covers_whole_file(segments)
+
+    def test_short_file_still_uses_idle_workers(self):
+        model, segments = self.run_segments(chunks_per_file=4, duration=150, pause_every=20)
+
+        self.assertEqual(len(model.calls), 4)
+        self.assert_covers_whole_file(segments)
+
+    def test_file_under_two_windows_is_not_split(self):
+        model, segments = self.run_segments(chunks_per_file=4, duration=45, pause_every=10)
+
+        self.assertEqual(len(model.calls), 1)
+        self.assert_covers_whole_file(segments)
+
+    def test_no_idle_workers_transcribes_in_one_pass(self):
+        model, segments = self.run_segments(chunks_per_file=1)
+
+        self.assertEqual(len(model.calls), 1)
+        self.assertTrue(model.options[0]["vad_filter"])
+        self.assert_covers_whole_file(segments)
+
+    def test_chunks_reuse_speech_timestamps_instead_of_vad(self):
+        model, segments = self.run_segments(chunks_per_file=4)
+
+        for first_sample, length in model.calls:
+            options = model.options[first_sample]
+            self.assertFalse(options["vad_filter"])
+            clips = options["clip_timestamps"]
+            self.assertTrue(clips)
+            self.assertGreaterEqual(clips[0], 0)
+            self.assertLessEqual(clips[-1], length / RATE)
+
+    def test_language_is_detected_once_for_all_chunks(self):
+        model, segments = self.run_segments(chunks_per_file=4, language="auto")
+
+        first, *rest = sorted(model.calls)
+        self.assertIsNone(model.options[first[0]]["language"])
+        for first_sample, _ in rest:
+            self.assertEqual(model.options[first_sample]["language"], FakeModel.detected_language)
+
+
+if __name__ == "__main__":
+    unittest.main()
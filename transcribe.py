@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import json
+import os
 import time
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -10,11 +12,44 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 
-from faster_whisper import WhisperModel
-
 # Supported audio extensions
 SUPPORTED_EXTS = {".mp3", ".wav", ".m4a", ".mp4", ".aac", ".flac", ".ogg"}
 
+# Whisper model to load. "small" is kept for its accuracy on call audio;
+# "tiny" and "base" are faster but make noticeably more mistakes, and the
+# distilled checkpoints (e.g. "distil-small.en") are English-only.
+# Switching to whisper.cpp with INT4 weights was declined: the app is built
+# on faster-whisper (CTranslate2), which has no 4-bit weight type.
+MODEL_NAME = "small"
+
+# With this many cores or more, a second model is loaded with several
+# workers (replicas), each with its own small thread pool, so several
+# files - or chunks of one file - are decoded in parallel.
+PARALLEL_MIN_CPUS = 8
+THREADS_PER_MODEL = 4
+
+# When some of those workers would otherwise sit idle (fewer files than
+# workers), each file is cut at silences into chunks of at least this many
+# seconds - one Whisper window - that are decoded in parallel on them.
+MIN_CHUNK_SECONDS = 30
+
+# Transcription languages offered in the UI. Setting one skips Whisper's
+# language detection pass; "auto" keeps detection on.
+LANGUAGES = ["auto", "en", "es", "fr", "de", "it", "pt", "nl"]
+DEFAULT_LANGUAGE = "en"
+
+# Whisper works on 16 kHz mono audio; files are decoded straight to this
+# rate in-process (PyAV) so transcribe() gets a ready-made array.
+SAMPLING_RATE = 16000
+
+# Tighter Silero VAD settings for call recordings ("Call mode"), which tend
+# to have long silences; less audio reaches the encoder.
+CALL_MODE_VAD_PARAMETERS = {
+    "threshold": 0.4,
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 200,
+}
+
 # Default output directory = Downloads
 DEFAULT_DOWNLOADS_DIR = Path.home() / "Downloads"
 
@@ -22,21 +57,54 @@ DEFAULT_DOWNLOADS_DIR = Path.home() / "Downloads"
 CONFIG_PATH = Path.home() / ".whisper_call_transcriber_config.json"
 
 
-def load_output_dir() -> Path:
+# Settings from CONFIG_PATH, read once and then kept in memory
+config_cache: dict | None = None
+
+
+def load_config() -> dict:
     """
-    Load the last-used output directory from config.
-    Falls back to Downloads if missing/invalid.
+    Load the saved settings from config (empty if missing/invalid).
+    The file is only read on the first call; later calls reuse the cache.
     """
+    global config_cache
+    if config_cache is not None:
+        return config_cache
+
+    config_cache = {}
     try:
         if CONFIG_PATH.exists():
             with CONFIG_PATH.open("r", encoding="utf-8") as f:
                 data = json.load(f)
-            out = Path(data.get("output_dir", ""))
-            if out.exists() and out.is_dir():
-                return out
+            if isinstance(data, dict):
+                config_cache = data
     except Exception:
         # If anything goes weird, ignore and fall back.
         pass
+    return config_cache
+
+
+def save_config(**settings):
+    """Merge the given settings into the config file."""
+    data = load_config()
+    data.update(settings)
+    try:
+        CONFIG_PATH.write_text(
+            json.dumps(data, indent=2),
+            encoding="utf-8",
+        )
+    except Exception:
+        # Not fatal if this fails; just ignore.
+        pass
+
+
+def load_output_dir() -> Path:
+    """
+    Load the last-used output directory from config.
+    Falls back to Downloads if missing/invalid.
+    """
+    out = Path(load_config().get("output_dir", ""))
+    if str(out) and out.exists() and out.is_dir():
+        return out
 
     # Ensure Downloads exists
     DEFAULT_DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
@@ -45,39 +113,190 @@ def load_output_dir() -> Path:
 
 def save_output_dir(output_dir: Path):
     """Save the chosen output directory to config."""
+    save_config(output_dir=str(output_dir))
+
+
+def load_language() -> str:
+    """Load the last-used language from config, defaulting to English."""
+    language = load_config().get("language", DEFAULT_LANGUAGE)
+    return language if language in LANGUAGES else DEFAULT_LANGUAGE
+
+
+def save_language(language: str):
+    """Save the chosen language to config."""
+    save_config(language=language)
+
+
+def load_call_mode() -> bool:
+    """Load whether call mode (aggressive VAD) is on. Defaults to on."""
+    return bool(load_config().get("call_mode", True))
+
+
+def save_call_mode(call_mode: bool):
+    """Save the call mode setting to config."""
+    save_config(call_mode=call_mode)
+
+
+def canonical_path(p: str) -> str:
+    """Canonical form of a path string, used to spot duplicate selections."""
+    return os.path.normcase(os.path.realpath(p))
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on.
+    Uses the affinity mask on Linux so taskset / container limits are respected.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def one_line(text: str, width: int = 80) -> str:
+    """Cut text to at most width characters for a single-line label."""
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def read_cpu_flags() -> set[str] | None:
+    """
+    Read the CPU feature flags from /proc/cpuinfo.
+    Returns None where that isn't available (e.g. Windows / macOS).
+    """
     try:
-        CONFIG_PATH.write_text(
-            json.dumps({"output_dir": str(output_dir)}, indent=2),
-            encoding="utf-8",
-        )
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
     except Exception:
-        # Not fatal if this fails; just ignore.
         pass
+    return None
 
 
-def load_model():
+def pick_compute_type() -> str:
+    """
+    Pick the fastest CPU compute type for this machine.
+    int8 kernels can be slower than float32 on CPUs without VNNI/AVX2,
+    so only use them when the hardware can actually speed them up.
     """
-    Load the Whisper 'small' model optimized for minimal hardware:
+    try:
+        import ctranslate2
+        supported = set(ctranslate2.get_supported_compute_types("cpu"))
+    except Exception:
+        return "auto"
+
+    flags = read_cpu_flags()
+    if flags is None:
+        # Can't inspect the CPU here; let CTranslate2 choose.
+        return "auto"
+
+    if "int8_float32" in supported and flags & {"avx512_vnni", "avx_vnni"}:
+        return "int8_float32"
+    if "int8" in supported and "avx2" in flags:
+        return "int8"
+    return "float32"
+
+
+def silence_split_points(speech_timestamps, num_samples, num_chunks, min_samples) -> list[int]:
+    """
+    Pick where to cut audio into (up to) num_chunks pieces of similar length.
+    Cuts go in the middle of the silences between speech_timestamps (dicts
+    with "start"/"end" sample offsets, as returned by faster-whisper's VAD),
+    so no speech - and so no Whisper segment - crosses a cut. Every piece is
+    at least min_samples long.
+    Returns the chunk edges in samples, from 0 to num_samples.
+    """
+    gaps = [
+        (prev["end"] + cur["start"]) // 2
+        for prev, cur in zip(speech_timestamps, speech_timestamps[1:])
+        if cur["start"] > prev["end"]
+    ]
+
+    edges = [0]
+    for i in range(1, num_chunks):
+        target = num_samples * i // num_chunks
+        candidates = [
+            g for g in gaps
+            if g - edges[-1] >= min_samples and num_samples - g >= min_samples
+        ]
+        if not candidates:
+            break
+        edges.append(min(candidates, key=lambda g: abs(g - target)))
+    edges.append(num_samples)
+    return edges
+
+
+def speech_clips(speech_timestamps, start, end) -> list[float]:
+    """
+    The speech between samples start and end, as faster-whisper
+    clip_timestamps: a flat [start, end, start, end, ...] list in seconds,
+    relative to start.
+    """
+    clips = []
+    for ts in speech_timestamps:
+        if ts["start"] >= start and ts["end"] <= end:
+            clips.append((ts["start"] - start) / SAMPLING_RATE)
+            clips.append((ts["end"] - start) / SAMPLING_RATE)
+    return clips
+
+
+def model_workers() -> int:
+    """How many parallel model workers to run on this machine."""
+    cpu_count = available_cpus()
+    if cpu_count >= PARALLEL_MIN_CPUS:
+        return cpu_count // THREADS_PER_MODEL
+    return 1
+
+
+def load_model(cpu_threads: int | None = None, num_workers: int = 1):
+    """
+    Load the Whisper model (MODEL_NAME) optimized for minimal hardware:
     - CPU device
-    - int8 quantization
+    - int8 quantization where the CPU supports it, float32 otherwise
+    - num_workers replicas with cpu_threads threads each (default: one
+      using every core)
     """
+    # Imported here rather than at the top: faster_whisper pulls in
+    # CTranslate2, numpy, PyAV etc. and would hold up the window appearing.
+    from faster_whisper import WhisperModel
+
     device = "cpu"
-    compute_type = "int8"  # Fast / low RAM on CPU
+    compute_type = pick_compute_type()
 
     model = WhisperModel(
-        "small",
+        MODEL_NAME,
         device=device,
         compute_type=compute_type,
-        cpu_threads=0,  # 0 = auto / use all cores
+        cpu_threads=cpu_threads or available_cpus(),
+        num_workers=num_workers,
     )
     return model
 
 
+def load_models():
+    """
+    Load the models used for transcription:
+    - one using every core, for a file that has the run to itself
+    - on bigger machines, one with model_workers() workers of
+      THREADS_PER_MODEL threads each, which batches are fanned out over
+      and single files are split across
+    Returns (model, parallel_model); parallel_model is None when there is
+    only one worker.
+    """
+    model = load_model()
+    parallel_model = None
+    num_workers = model_workers()
+    if num_workers > 1:
+        parallel_model = load_model(
+            cpu_threads=THREADS_PER_MODEL, num_workers=num_workers
+        )
+    return model, parallel_model
+
+
 class TranscriberApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Whisper Call Transcriber")
-        self.root.geometry("650x450")
+        self.root.geometry("650x600")
         self.root.resizable(False, False)
 
         # Message queue from worker thread -> GUI thread
@@ -85,18 +304,47 @@ class TranscriberApp:
 
         # File lists
         self.audio_files: list[Path] = []   # files the user has staged
+        self.resolved_files: set[str] = set()  # canonical staged paths, for dedup
         self.worker_files: list[Path] = []  # snapshot used by the worker
         self.total_files = 0
         self.files_done = 0  # how many files fully finished
+        # Files being transcribed right now, by worker id. With several
+        # workers the current-file widgets follow the oldest of them.
+        self.active_files: dict[int, dict] = {}
+        self.shown_worker: int | None = None
+        self.batch_timestamp = ""  # when the current run started, for file names
 
         # Output directory (default: Downloads or last-used)
         self.output_dir: Path = load_output_dir()
 
+        # Transcription language ("auto" = let Whisper detect it)
+        self.language: str = load_language()
+        self.worker_language: str = self.language  # snapshot used by the worker
+
+        # Call mode = aggressive VAD tuned for call recordings
+        self.call_mode = tk.BooleanVar(value=load_call_mode())
+        self.worker_call_mode: bool = self.call_mode.get()
+
         # Transcribing state
         self.is_transcribing = False
 
+        # Models are loaded once in the background and reused for every run
+        self.model = None
+        self.parallel_model = None
+        self.model_workers = model_workers()
+        self.model_ready = threading.Event()
+
+        # Per-run model layout, set when a run starts
+        self.chunks_per_file = 1  # how many workers each file may split across
+        self.single_pass_model = None  # model for files that aren't split
+
+        # Start the (import-heavy) model load before building the UI so the
+        # two overlap
+        threading.Thread(target=self.preload_models, daemon=True).start()
+
         # UI elements
         self.create_widgets()
+        self.info_label.config(text=f"Loading model ({MODEL_NAME} on CPU)...")
 
         # Start polling the queue
         self.root.after(100, self.process_queue)
@@ -112,12 +360,12 @@ class TranscriberApp:
         )
         self.info_label.pack(padx=10, pady=6)
 
-               # --- File progress (percent within current file) ---
+        # --- File progress (percent within current file) ---
         self.file_progress_label = ttk.Label(
             self.root,
             text="File progress: 0%",
         )
-        self.info_label.pack(padx=10, pady=6)
+        self.file_progress_label.pack(padx=10, pady=6)
 
         self.file_progress_bar = ttk.Progressbar(
             self.root,
@@ -126,14 +374,14 @@ class TranscriberApp:
             mode="determinate",
             maximum=100,
         )
-        self.info_label.pack(padx=10, pady=6)
+        self.file_progress_bar.pack(padx=10, pady=6)
 
         # --- Overall progress (files done out of total) ---
         self.overall_progress_label = ttk.Label(
             self.root,
             text="Overall: 0 / 0 files",
         )
-        self.info_label.pack(padx=10, pady=6)
+        self.overall_progress_label.pack(padx=10, pady=6)
 
         self.overall_progress_bar = ttk.Progressbar(
             self.root,
@@ -142,16 +390,13 @@ class TranscriberApp:
             mode="determinate",
             maximum=1,   # will be set when a run starts
         )
-        self.info_label.pack(padx=10, pady=6)
-
+        self.overall_progress_bar.pack(padx=10, pady=6)
 
         self.current_text_label = ttk.Label(
             self.root,
             text="Current text: (none)",
-            wraplength=620,
-            justify="center",
         )
-        self.info_label.pack(padx=10, pady=6)
+        self.current_text_label.pack(padx=10, pady=6)
 
         self.current_file_label = ttk.Label(
             self.root,
@@ -159,7 +404,7 @@ class TranscriberApp:
             wraplength=620,
             justify="center",
         )
-        self.info_label.pack(padx=10, pady=6)
+        self.current_file_label.pack(padx=10, pady=6)
 
         # Selected files list
         files_frame = ttk.LabelFrame(self.root, text="Selected files")
@@ -200,6 +445,30 @@ class TranscriberApp:
         )
         self.change_output_button.pack(side="left")
 
+        # Language chooser
+        options_frame = ttk.Frame(self.root)
+        options_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        ttk.Label(options_frame, text="Language:").pack(side="left", padx=(0, 5))
+
+        self.language_combo = ttk.Combobox(
+            options_frame,
+            values=LANGUAGES,
+            state="readonly",
+            width=8,
+        )
+        self.language_combo.set(self.language)
+        self.language_combo.bind("<<ComboboxSelected>>", self.on_change_language)
+        self.language_combo.pack(side="left")
+
+        self.call_mode_check = ttk.Checkbutton(
+            options_frame,
+            text="Call mode (aggressive VAD)",
+            variable=self.call_mode,
+            command=self.on_change_call_mode,
+        )
+        self.call_mode_check.pack(side="left", padx=(15, 0))
+
         # Buttons: Select / Start / Quit
         self.button_frame = ttk.Frame(self.root)
         self.button_frame.pack(pady=10)
@@ -251,6 +520,15 @@ class TranscriberApp:
         self.output_label.config(text=f"Output folder: {self.output_dir}")
         save_output_dir(self.output_dir)
 
+    def on_change_language(self, event=None):
+        """Remember the language picked in the combobox."""
+        self.language = self.language_combo.get()
+        save_language(self.language)
+
+    def on_change_call_mode(self):
+        """Remember the call mode checkbox state."""
+        save_call_mode(self.call_mode.get())
+
     def on_select_files(self):
         """Select additional files and append to the list (no duplicates)."""
         if self.is_transcribing:
@@ -272,26 +550,23 @@ class TranscriberApp:
         if not filepaths:
             return
 
-        added = 0
+        new_names: list[str] = []
         for p in filepaths:
-            path_obj = Path(p)
-            if path_obj.suffix.lower() not in SUPPORTED_EXTS:
+            if os.path.splitext(p)[1].lower() not in SUPPORTED_EXTS:
                 continue
 
-            # Avoid duplicates: compare by resolved path if possible
-            try:
-                resolved = path_obj.resolve()
-            except Exception:
-                resolved = path_obj
-
-            already = any(
-                (f.resolve() if f.exists() else f) == resolved
-                for f in self.audio_files
-            )
-            if not already:
+            # Avoid duplicates: compare by canonical path string
+            key = canonical_path(p)
+            if key not in self.resolved_files:
+                self.resolved_files.add(key)
+                path_obj = Path(p)
                 self.audio_files.append(path_obj)
-                self.file_listbox.insert(tk.END, path_obj.name)
-                added += 1
+                new_names.append(path_obj.name)
+
+        # One insert for the whole selection, so the listbox lays out once
+        added = len(new_names)
+        if added > 0:
+            self.file_listbox.insert(tk.END, *new_names)
 
         self.total_files = len(self.audio_files)
         if self.total_files == 0:
@@ -303,7 +578,13 @@ class TranscriberApp:
             self.start_button.config(state="disabled")
             return
 
-        # Enable Start if we have at least one file
+        # Enable Start if we have at least one file and the model is ready
+        if not self.model_ready.is_set():
+            self.info_label.config(
+                text=f"{self.total_files} file(s) selected. Waiting for model to load..."
+            )
+            return
+
         self.start_button.config(state="normal")
 
         if added > 0:
@@ -329,12 +610,17 @@ class TranscriberApp:
 
         # Take a snapshot of current files for this run
         self.worker_files = list(self.audio_files)
+        self.worker_language = self.language
+        self.worker_call_mode = self.call_mode.get()
         self.total_files = len(self.worker_files)
         self.files_done = 0
+        self.active_files.clear()
+        self.shown_worker = None
         self.is_transcribing = True
 
         # Clear staged files for the next run
         self.audio_files.clear()
+        self.resolved_files.clear()
         self.file_listbox.delete(0, tk.END)
 
         # Reset progress
@@ -354,6 +640,8 @@ class TranscriberApp:
         self.select_button.config(state="disabled")
         self.start_button.config(state="disabled")
         self.change_output_button.config(state="disabled")
+        self.language_combo.config(state="disabled")
+        self.call_mode_check.config(state="disabled")
 
         # Start worker thread
         worker_thread = threading.Thread(
@@ -365,70 +653,61 @@ class TranscriberApp:
 
     # ---------- Worker & queue ----------
 
+    def preload_models(self):
+        """Load the models at startup, while the user is picking files."""
+        try:
+            self.model, self.parallel_model = load_models()
+            msg = ("model_ready",)
+        except Exception as e:
+            # Start stays usable; the worker will try loading again.
+            msg = ("model_error", str(e))
+        self.model_ready.set()
+        self.queue.put(msg)
+
     def worker_transcribe_all(self):
         try:
             start_time = time.time()
-            self.queue.put(("status", "Loading model (small, int8 on CPU)..."))
-
-            model = load_model()
-            self.queue.put(("status", "Model loaded. Starting transcription..."))
-
-            for idx, audio_path in enumerate(self.worker_files, start=1):
-                file_start = time.time()
-                self.queue.put((
-                    "file_start",
-                    idx,
-                    self.total_files,
-                    audio_path.name,
-                ))
-
-                # Transcribe this file, streaming segments
-                segments, info = model.transcribe(
-                    str(audio_path),
-                    beam_size=1,        # greedy decoding, fastest
-                    vad_filter=True,   # no extra VAD overhead
-                    word_timestamps=False,
+            self.batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+            if self.model is None:
+                self.queue.put(("status", f"Loading model ({MODEL_NAME} on CPU)..."))
+                self.model, self.parallel_model = load_models()
+            self.queue.put(("status", "Starting transcription..."))
+
+            # One file at a time per parallel worker; no point in more
+            # threads than there are files
+            num_threads = min(self.model_workers, len(self.worker_files))
+
+            # Workers left over when there are fewer files than workers are
+            # shared out so each file can be split across its own idle ones
+            self.chunks_per_file = max(1, self.model_workers // num_threads)
+
+            # A file that has the run to itself and isn't split gets the
+            # model that uses every core
+            self.single_pass_model = self.model if num_threads == 1 else self.parallel_model
+
+            jobs = queue.Queue()
+            for job in enumerate(self.worker_files, start=1):
+                jobs.put(job)
+
+            stop = threading.Event()
+            errors = []
+            threads = [
+                threading.Thread(
+                    target=self.worker_loop,
+                    args=(worker_id, num_threads, jobs, stop, errors),
+                    daemon=True,
                 )
+                for worker_id in range(1, num_threads + 1)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
 
-                duration = getattr(info, "duration", None) or 0.0
-                lines = []
-
-                for seg in segments:
-                    text = (seg.text or "").strip()
-                    if not text:
-                        continue
-                    lines.append(text)
-
-                    # Compute per-file progress based on segment end vs total duration
-                    if duration > 0 and seg.end is not None:
-                        percent = int(min(max(seg.end / duration * 100, 0), 100))
-                    else:
-                        percent = 0
-
-                    # Update GUI with current text chunk and percent
-                    self.queue.put(("segment", text, percent))
-
-                # Timestamp when transcription finished
-                timestamp_str = datetime.now().strftime("%H%M%S")
-                out_name = f"Call{idx}_{timestamp_str}.txt"
-                out_path = self.output_dir / out_name
-
-                self.output_dir.mkdir(parents=True, exist_ok=True)
-
-                # Write transcript with a blank line between each line
-                with out_path.open("w", encoding="utf-8") as f:
-                    for line in lines:
-                        f.write(line + "\n\n")
-
-                file_elapsed = time.time() - file_start
-                self.queue.put((
-                    "file_done",
-                    idx,
-                    self.total_files,
-                    audio_path.name,
-                    str(out_path),
-                    file_elapsed,
-                ))
+            if errors:
+                raise errors[0]
 
             total_elapsed = time.time() - start_time
             self.queue.put(("all_done", total_elapsed))
@@ -436,14 +715,199 @@ class TranscriberApp:
         except Exception as e:
             self.queue.put(("error", str(e)))
 
+    def worker_loop(self, worker_id, num_threads, jobs, stop, errors):
+        """Transcribe files from the shared job queue, one at a time."""
+        try:
+            # Decode the next file's audio in the background while the
+            # current one is being transcribed - but only while there are
+            # enough jobs left for every other worker too. Otherwise leave
+            # them on the queue for whichever worker frees up first.
+            with ThreadPoolExecutor(max_workers=1) as decoder:
+                pending = self.take_job(jobs, decoder)
+                while pending is not None and not stop.is_set():
+                    idx, audio_path, audio_future = pending
+                    audio = audio_future.result()
+                    pending = None
+                    if jobs.qsize() >= num_threads:
+                        pending = self.take_job(jobs, decoder)
+                    self.transcribe_file(worker_id, idx, audio_path, audio)
+                    if pending is None:
+                        pending = self.take_job(jobs, decoder)
+        except Exception as e:
+            # Tell the other workers to stop after their current file.
+            errors.append(e)
+            stop.set()
+
+    def take_job(self, jobs, decoder):
+        """Take the next file off the job queue and start decoding it."""
+        from faster_whisper.audio import decode_audio
+
+        try:
+            idx, audio_path = jobs.get_nowait()
+        except queue.Empty:
+            return None
+        audio_future = decoder.submit(
+            decode_audio, str(audio_path), sampling_rate=SAMPLING_RATE
+        )
+        return idx, audio_path, audio_future
+
+    def transcribe_options(self) -> dict:
+        """Keyword arguments for model.transcribe() in the current run."""
+        return dict(
+            language=None if self.worker_language == "auto" else self.worker_language,
+            beam_size=1,        # greedy decoding, fastest
+            condition_on_previous_text=False,  # independent windows, no repeat loops
+            no_speech_threshold=0.6,
+            compression_ratio_threshold=2.4,
+            vad_filter=True,   # only run the encoder on speech
+            vad_parameters=CALL_MODE_VAD_PARAMETERS if self.worker_call_mode else None,
+            word_timestamps=False,
+        )
+
+    def iter_segments(self, audio, duration):
+        """
+        Yield (text, end) for each segment of a decoded file, in order.
+        When there are idle model workers, the file is cut at silences into
+        chunks that are decoded in parallel on them and joined back together.
+        """
+        num_chunks = min(self.chunks_per_file, int(duration // MIN_CHUNK_SECONDS))
+        edges = []
+        if num_chunks > 1:
+            from faster_whisper.vad import get_speech_timestamps
+
+            vad_parameters = CALL_MODE_VAD_PARAMETERS if self.worker_call_mode else {}
+            speech = get_speech_timestamps(audio, **vad_parameters)
+            edges = silence_split_points(
+                speech, len(audio), num_chunks, MIN_CHUNK_SECONDS * SAMPLING_RATE
+            )
+
+        if len(edges) < 3:
+            # No idle workers, too short, or no silence to cut at:
+            # one pass over the whole file
+            segments, _ = self.single_pass_model.transcribe(
+                audio, **self.transcribe_options()
+            )
+            for seg in segments:
+                yield seg.text, seg.end
+            return
+
+        # The speech found above is handed to each chunk as clip_timestamps
+        # rather than running VAD again. The language is detected once, on
+        # the first chunk, and used for the rest so they all agree.
+        options = self.transcribe_options()
+        options.update(vad_filter=False, vad_parameters=None)
+        chunks = list(zip(edges, edges[1:]))
+
+        first_start, first_end = chunks[0]
+        first_segments, info = self.parallel_model.transcribe(
+            audio[first_start:first_end],
+            clip_timestamps=speech_clips(speech, first_start, first_end),
+            **options,
+        )
+        options["language"] = info.language
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [pool.submit(self.collect_segments, first_segments, first_start)]
+            for start, end in chunks[1:]:
+                futures.append(pool.submit(
+                    self.transcribe_chunk, audio, start, end, speech, options
+                ))
+
+            # Chunks are in time order, so results can be streamed out as
+            # soon as each earlier chunk has finished
+            for future in futures:
+                yield from future.result()
+
+    def transcribe_chunk(self, audio, start, end, speech, options):
+        """
+        Transcribe the speech in audio[start:end] (samples) and return
+        (text, end) for its segments, with end times relative to the whole file.
+        """
+        segments, _ = self.parallel_model.transcribe(
+            audio[start:end],
+            clip_timestamps=speech_clips(speech, start, end),
+            **options,
+        )
+        return self.collect_segments(segments, start)
+
+    def collect_segments(self, segments, start):
+        """(text, end) for a chunk's segments, shifted by its start sample."""
+        offset = start / SAMPLING_RATE
+        return [(seg.text, offset + seg.end) for seg in segments]
+
+    def transcribe_file(self, worker_id, idx, audio_path, audio):
+        """Transcribe one (already decoded) file and write its transcript."""
+        file_start = time.time()
+        self.queue.put((
+            "file_start",
+            idx,
+            self.total_files,
+            audio_path.name,
+            worker_id,
+        ))
+
+        duration = len(audio) / SAMPLING_RATE
+
+        # Batch timestamp + index keeps names unique within and across runs
+        out_name = f"Call{idx:03d}_{self.batch_timestamp}.txt"
+        out_path = self.output_dir / out_name
+
+        # Stream the transcript to disk as segments come in, with a blank
+        # line between each line, so memory use stays flat however long
+        # the recording is.
+        with out_path.open("w", encoding="utf-8", buffering=65536) as f:
+            for text, end in self.iter_segments(audio, duration):
+                text = (text or "").strip()
+                if not text:
+                    continue
+                f.write(text + "\n\n")
+
+                # Compute per-file progress based on segment end vs total duration
+                if duration > 0 and end is not None:
+                    percent = int(min(max(end / duration * 100, 0), 100))
+                else:
+                    percent = 0
+
+                # Update GUI with current text chunk and percent
+                self.queue.put(("segment", text, percent, worker_id))
+
+        file_elapsed = time.time() - file_start
+        self.queue.put((
+            "file_done",
+            idx,
+            self.total_files,
+            audio_path.name,
+            str(out_path),
+            file_elapsed,
+            worker_id,
+        ))
+
     def process_queue(self):
+        messages = []
         try:
             while True:
-                msg = self.queue.get_nowait()
-                self.handle_message(msg)
+                messages.append(self.queue.get_nowait())
         except queue.Empty:
             pass
 
+        # Segments can arrive much faster than anyone can read them, so of
+        # each run of back-to-back segment messages only show the last one
+        # per worker. Walk backwards to know which ones come last.
+        keep = []
+        seen_workers = set()
+        for msg in reversed(messages):
+            if msg[0] == "segment":
+                worker_id = msg[3]
+                if worker_id in seen_workers:
+                    continue
+                seen_workers.add(worker_id)
+            else:
+                seen_workers.clear()
+            keep.append(msg)
+
+        for msg in reversed(keep):
+            self.handle_message(msg)
+
         # Keep polling
         self.root.after(100, self.process_queue)
 
@@ -454,14 +918,29 @@ class TranscriberApp:
             _, text = msg
             self.info_label.config(text=text)
 
+        elif msg_type in ("model_ready", "model_error"):
+            if msg_type == "model_ready":
+                text = "Model loaded."
+            else:
+                text = f"Model failed to load ({msg[1]}). It will be retried on Start."
+
+            if self.audio_files and not self.is_transcribing:
+                self.start_button.config(state="normal")
+                text += f" {len(self.audio_files)} file(s) selected. Ready to start."
+            elif not self.is_transcribing:
+                text += " Select call recording files to transcribe."
+            self.info_label.config(text=text)
+
         elif msg_type == "file_start":
-            _, idx, total, filename = msg
-            self.current_file_label.config(
-                text=f"Current file: ({idx} / {total}) {filename}"
-            )
-            self.current_text_label.config(text="Current text: (none)")
-            self.file_progress_bar["value"] = 0
-            self.file_progress_label.config(text="File progress: 0%")
+            _, idx, total, filename, worker_id = msg
+            self.active_files[worker_id] = {
+                "idx": idx,
+                "total": total,
+                "filename": filename,
+                "text": "(none)",
+                "percent": 0,
+            }
+            self.show_active_file()
 
             self.overall_progress_label.config(
                 text=f"Overall: {self.files_done} / {self.total_files} files"
@@ -470,25 +949,43 @@ class TranscriberApp:
 
 
         elif msg_type == "segment":
-            _, text, percent = msg
-            # Show latest segment being transcribed
+            _, text, percent, worker_id = msg
+            entry = self.active_files.get(worker_id)
+            if entry is None:
+                return
+            entry["text"] = text
+            entry["percent"] = percent
+
+            # Only the file shown in the current-file widgets updates them
+            if worker_id != self.shown_worker:
+                return
+
+            # Show latest segment being transcribed, cut to one line so the
+            # label doesn't have to re-wrap on every update
             self.current_text_label.config(
-                text=f"Current text: {text}"
+                text=f"Current text: {one_line(text)}"
             )
             # Percent is per-file; X / N is files done
-            self.file_progress_bar["value"] = percent
-            self.file_progress_label.config(text=f"File progress: {percent}%")
+            if percent != int(self.file_progress_bar["value"]):
+                self.file_progress_bar["value"] = percent
+                self.file_progress_label.config(text=f"File progress: {percent}%")
 
 
         elif msg_type == "file_done":
-            _, idx, total, filename, out_path, file_elapsed = msg
+            _, idx, total, filename, out_path, file_elapsed, worker_id = msg
 
             # Mark this file as done
             self.files_done += 1
+            self.active_files.pop(worker_id, None)
 
-            # Force progress to 100% for this file
-            self.file_progress_bar["value"] = 100
-            self.file_progress_label.config(text="File progress: 100%")
+            if self.active_files:
+                # Move on to the oldest file still in progress
+                self.show_active_file()
+            else:
+                # Force progress to 100% for this file
+                self.shown_worker = None
+                self.file_progress_bar["value"] = 100
+                self.file_progress_label.config(text="File progress: 100%")
 
             self.overall_progress_bar["value"] = self.files_done
             self.overall_progress_label.config(
@@ -518,6 +1015,8 @@ class TranscriberApp:
             self.select_button.config(state="normal")
             self.start_button.config(state="normal")
             self.change_output_button.config(state="normal")
+            self.language_combo.config(state="readonly")
+            self.call_mode_check.config(state="normal")
 
         elif msg_type == "error":
             _, err_text = msg
@@ -525,9 +1024,26 @@ class TranscriberApp:
             self.select_button.config(state="normal")
             self.start_button.config(state="normal")
             self.change_output_button.config(state="normal")
+            self.language_combo.config(state="readonly")
+            self.call_mode_check.config(state="normal")
             messagebox.showerror("Error", f"An error occurred:\n\n{err_text}")
             self.info_label.config(text="Error occurred. See message box.")
 
+    def show_active_file(self):
+        """Point the current-file widgets at the oldest file in progress."""
+        self.shown_worker = min(
+            self.active_files,
+            key=lambda worker_id: self.active_files[worker_id]["idx"],
+        )
+        entry = self.active_files[self.shown_worker]
+
+        self.current_file_label.config(
+            text=f"Current file: ({entry['idx']} / {entry['total']}) {entry['filename']}"
+        )
+        self.current_text_label.config(text=f"Current text: {one_line(entry['text'])}")
+        self.file_progress_bar["value"] = entry["percent"]
+        self.file_progress_label.config(text=f"File progress: {entry['percent']}%")
+
     def run(self):
         self.root.mainloop()
 